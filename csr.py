@@ -0,0 +1,48 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def build_csr(num_nodes: int, edges) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert undirected (source, destination, weight) edges to CSR arrays.
+    
+    Each edge is stored in both directions and the entries are grouped by
+    source node, so the neighbors of u are indices[indptr[u]:indptr[u + 1]].
+    Weights are downcast to int32 when they are all whole numbers (such as
+    road distances in km) and to float32 when every weight survives the
+    cast exactly, halving memory traffic in the shortest-path kernels.
+    Weights that either cast would round are kept in float64. Distances
+    are always accumulated in float64.
+    
+    Time Complexity: O(E log E) for sorting edges by source
+    
+    Args:
+        num_nodes: Total number of nodes
+        edges: Sequence of (source, destination, weight) tuples
+    
+    Returns:
+        indptr: int32 array of length num_nodes + 1
+        indices: int32 array of neighbor node IDs
+        weights: int32, float32 or float64 array of edge weights, aligned with indices
+    """
+    edges = np.asarray(edges, dtype=np.float64).reshape(-1, 3)
+    u = edges[:, 0].astype(np.int32)
+    v = edges[:, 1].astype(np.int32)
+    w = edges[:, 2]
+    
+    if np.all(w == np.rint(w)) and np.all(np.abs(w) <= np.iinfo(np.int32).max):
+        w = w.astype(np.int32)
+    elif np.array_equal(w.astype(np.float32), w):
+        w = w.astype(np.float32)
+    
+    # Bidirectional graph (can travel both ways)
+    src = np.concatenate([u, v])
+    dst = np.concatenate([v, u])
+    wts = np.concatenate([w, w])
+    
+    order = np.argsort(src, kind='stable')
+    indptr = np.zeros(num_nodes + 1, dtype=np.int32)
+    indptr[1:] = np.cumsum(np.bincount(src, minlength=num_nodes))
+    
+    return indptr, dst[order], wts[order]
@@ -1,5 +1,8 @@
+from functools import cache
 from typing import Dict, List, Tuple
 
+from csr import build_csr
+
 
 # Relief Centers Configuration
 # Format: (center_id, name, supply_capacity)
@@ -132,6 +135,25 @@ GRAPH_EDGES = [
 ]
 
 
+# Road network in CSR form, built once at import time and shared read-only
+# by every Graph.from_static() instance
+ADJ_INDPTR, ADJ_INDICES, ADJ_WEIGHTS = build_csr(
+    len(RELIEF_CENTERS) + len(DISASTER_ZONES), GRAPH_EDGES
+)
+for _array in (ADJ_INDPTR, ADJ_INDICES, ADJ_WEIGHTS):
+    _array.setflags(write=False)
+
+
+# Lookup tables derived once at import time
+NODE_NAMES = (
+    {center['id']: center['name'] for center in RELIEF_CENTERS}
+    | {zone['id']: zone['name'] for zone in DISASTER_ZONES}
+)
+_RELIEF_IDS = [center['id'] for center in RELIEF_CENTERS]
+_ZONE_IDS = [zone['id'] for zone in DISASTER_ZONES]
+_PRIORITY_LABELS = {1: 'CRITICAL', 2: 'HIGH', 3: 'MEDIUM', 4: 'LOW'}
+
+
 def get_total_nodes() -> int:
     """
     Get total number of nodes in the graph.
@@ -147,9 +169,9 @@ def get_relief_center_ids() -> List[int]:
     Get list of all relief center node IDs.
     
     Returns:
-        List of center IDs
+        List of center IDs (shared, do not modify)
     """
-    return [center['id'] for center in RELIEF_CENTERS]
+    return _RELIEF_IDS
 
 
 def get_disaster_zone_ids() -> List[int]:
@@ -157,9 +179,9 @@ def get_disaster_zone_ids() -> List[int]:
     Get list of all disaster zone node IDs.
     
     Returns:
-        List of zone IDs
+        List of zone IDs (shared, do not modify)
     """
-    return [zone['id'] for zone in DISASTER_ZONES]
+    return _ZONE_IDS
 
 
 def get_node_name(node_id: int) -> str:
@@ -172,23 +194,16 @@ def get_node_name(node_id: int) -> str:
     Returns:
         Name of the node
     """
-    # Check relief centers
-    for center in RELIEF_CENTERS:
-        if center['id'] == node_id:
-            return center['name']
-    
-    # Check disaster zones
-    for zone in DISASTER_ZONES:
-        if zone['id'] == node_id:
-            return zone['name']
-    
-    return f"Unknown Node {node_id}"
+    return NODE_NAMES.get(node_id, f"Unknown Node {node_id}")
 
 
+@cache
 def get_statistics() -> Dict:
     """
     Get summary statistics about the scenario.
     
+    Computed once; the scenario data is fixed at import time.
+    
     Returns:
         Dictionary containing scenario statistics
     """
@@ -222,11 +237,10 @@ def print_scenario_info():
     
     print("🚨 DISASTER ZONES:")
     print("-" * 80)
-    priority_labels = {1: 'CRITICAL', 2: 'HIGH', 3: 'MEDIUM', 4: 'LOW'}
     for zone in DISASTER_ZONES:
         print(f"  [{zone['id']}] {zone['name']}")
         print(f"      Location: {zone['location']}")
-        print(f"      Priority: {priority_labels.get(zone['priority'], 'UNKNOWN')}")
+        print(f"      Priority: {_PRIORITY_LABELS.get(zone['priority'], 'UNKNOWN')}")
         print(f"      Demand: {zone['demand']} units")
         print(f"      Description: {zone['description']}")
         print()
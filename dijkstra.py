@@ -1,11 +1,210 @@
-import heapq
-from typing import List, Dict, Tuple
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from heapq import heappop, heappush
+from math import inf
+from typing import List, Dict, Tuple, Union
+
+import numpy as np
+
+from csr import build_csr
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra as csgraph_dijkstra
+    from scipy.sparse.csgraph import reverse_cuthill_mckee
+except ImportError:
+    # SciPy is optional; compute_all_shortest_paths runs one source at a time
+    # on the graph in its original node order
+    csr_matrix = None
+    csgraph_dijkstra = None
+    reverse_cuthill_mckee = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; Graph.dijkstra_arrays falls back to dense NumPy
+    njit = None
+
+
+def _dijkstra_csr(indptr, indices, weights, start, n, targets):
+    """
+    Indexed-heap Dijkstra over CSR arrays, compiled with Numba when available.
+    
+    The binary min-heap holds each node at most once: heap[k] is a node,
+    pos[node] is its slot (-1 if not queued), and dist[node] is its key.
+    A shorter path found for a queued node is a decrease-key (sift up)
+    rather than a duplicate push, so the heap never exceeds V entries and
+    no visited set is needed.
+    
+    If any targets are flagged, the search stops as soon as the last of
+    them is settled instead of exploring the whole graph.
+    
+    Time Complexity: O((V + E) log V)
+    
+    Args:
+        indptr, indices, weights: CSR adjacency (neighbors of u are
+            indices[indptr[u]:indptr[u + 1]])
+        start: The node to start from
+        n: Number of nodes
+        targets: Boolean array of length n; all False means search everything
+    
+    Returns:
+        dist: Array of shortest distances from start (inf if unreachable);
+            exact for targets, upper bounds elsewhere after an early stop
+        prev: Array of previous node in shortest path (-1 if none)
+    """
+    dist = np.full(n, np.inf)
+    prev = np.full(n, -1, dtype=np.int64)
+    heap = np.empty(n, dtype=np.int64)
+    pos = np.full(n, -1, dtype=np.int64)
+    
+    dist[start] = 0.0
+    heap[0] = start
+    pos[start] = 0
+    size = 1
+    
+    remaining = 0
+    for v in range(n):
+        if targets[v]:
+            remaining += 1
+    if remaining == 0:
+        remaining = -1  # No targets: never stop early
+    
+    while size > 0:
+        # Pop the root, then sift the last node down into its place
+        u = heap[0]
+        pos[u] = -1
+        size -= 1
+        if size > 0:
+            last = heap[size]
+            key = dist[last]
+            slot = 0
+            while True:
+                child = 2 * slot + 1
+                if child >= size:
+                    break
+                if child + 1 < size and dist[heap[child + 1]] < dist[heap[child]]:
+                    child += 1
+                child_node = heap[child]
+                if dist[child_node] >= key:
+                    break
+                heap[slot] = child_node
+                pos[child_node] = slot
+                slot = child
+            heap[slot] = last
+            pos[last] = slot
+        
+        # Stop once every target is settled
+        if targets[u]:
+            remaining -= 1
+            if remaining == 0:
+                break
+        
+        # Relax neighbors; settled nodes can never improve
+        d = dist[u]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = d + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                
+                # Insert at the bottom, or decrease-key in place
+                slot = pos[v]
+                if slot == -1:
+                    slot = size
+                    size += 1
+                while slot > 0:
+                    parent = (slot - 1) // 2
+                    parent_node = heap[parent]
+                    if dist[parent_node] <= nd:
+                        break
+                    heap[slot] = parent_node
+                    pos[parent_node] = slot
+                    slot = parent
+                heap[slot] = v
+                pos[v] = slot
+    
+    return dist, prev
+
+
+if njit is not None:
+    _dijkstra_csr = njit(cache=True, nogil=True)(_dijkstra_csr)
+
+
+# Without Numba, graphs with fewer stored edges than this fraction of V^2
+# use the heapq search; denser graphs use the vectorized dense version
+SPARSE_FILL = 0.125
+
+
+def _dijkstra_heap(indptr, indices, weights, start, n, targets):
+    """
+    Binary-heap Dijkstra over CSR arrays in plain Python, using heapq.
+    
+    Entries are (distance, node) tuples. Instead of a decrease-key, an
+    improved node is pushed again and the outdated entry is skipped when
+    popped (lazy deletion); a bytearray marks settled nodes.
+    
+    Time Complexity: O((V + E) log E)
+    
+    Args:
+        indptr, indices, weights: CSR adjacency (neighbors of u are
+            indices[indptr[u]:indptr[u + 1]])
+        start: The node to start from
+        n: Number of nodes
+        targets: Boolean array of length n; all False means search everything
+    
+    Returns:
+        dist: Array of shortest distances from start (inf if unreachable);
+            exact for targets, upper bounds elsewhere after an early stop
+        prev: Array of previous node in shortest path (-1 if none)
+    """
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    weights = weights.tolist()
+    is_target = targets.tolist()
+    
+    best = [inf] * n
+    prev = [-1] * n
+    settled = bytearray(n)
+    best[start] = 0.0
+    heap = [(0.0, start)]
+    remaining = sum(is_target) or -1  # -1: never stop early
+    
+    while heap:
+        d, u = heappop(heap)
+        if settled[u]:
+            continue  # Stale entry, u was already reached more cheaply
+        settled[u] = 1
+        
+        # Stop once every target is settled
+        if is_target[u]:
+            remaining -= 1
+            if remaining == 0:
+                break
+        
+        # Relax neighbors; settled nodes can never improve
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = d + weights[k]
+            if nd < best[v]:
+                best[v] = nd
+                prev[v] = u
+                heappush(heap, (nd, v))
+    
+    return np.array(best, dtype=np.float64), np.array(prev, dtype=np.int64)
 
 
 class Graph:
     """
     Graph class to represent the network of relief centers and disaster zones.
-    Uses adjacency list representation for efficient storage and traversal.
+    
+    Edges are collected once each with add_edge(), then consolidated by
+    freeze() into a Compressed Sparse Row (CSR) layout: the neighbors of u
+    are indices[indptr[u]:indptr[u + 1]] with matching weights. All
+    shortest-path methods read this frozen form. Adding edges after that
+    still works but is deprecated, since it discards the CSR arrays.
     """
     
     def __init__(self, num_nodes: int):
@@ -16,123 +215,428 @@ class Graph:
             num_nodes: Total number of nodes (relief centers + disaster zones)
         """
         self.num_nodes = num_nodes
-        self.adjacency_list = {i: [] for i in range(num_nodes)}
+        # Undirected edges as (source, destination, weight), one copy each
+        self._edges = []
+        self.frozen = False
+        
+        # Filled in by freeze()
+        self.indptr = None
+        self.indices = None
+        self.weights = None
+        # Dense weight matrix: W[u, v] = edge weight, inf if no direct edge.
+        # O(V^2) memory, so only built by dense_weights() for the dense search
+        self.W = None
+        # SciPy CSR matrix, built on demand
+        self._csr = None
     
     def add_edge(self, source: int, destination: int, weight: float):
         """
         Add a bidirectional edge between two nodes.
         
+        Adding to a frozen graph is deprecated: it emits a DeprecationWarning
+        and unfreezes the graph, so the next shortest-path call rebuilds the
+        CSR arrays.
+        
         Args:
             source: Starting node
             destination: Ending node
             weight: Distance/cost between nodes
         """
-        # Bidirectional graph (can travel both ways)
-        self.adjacency_list[source].append((destination, weight))
-        self.adjacency_list[destination].append((source, weight))
+        if self.frozen:
+            warnings.warn("Adding edges to a frozen Graph is deprecated; add all "
+                          "edges before the first shortest-path call",
+                          DeprecationWarning, stacklevel=2)
+            self._unfreeze()
+        
+        # Stored once; both directions are materialized by freeze()
+        self._edges.append((source, destination, weight))
     
-    def dijkstra(self, start_node: int) -> Tuple[Dict[int, float], Dict[int, int]]:
+    def freeze(self) -> 'Graph':
+        """
+        Consolidate the collected edges into CSR arrays.
+        
+        Called automatically by the shortest-path methods. Afterwards the
+        graph is meant to be read-only (see add_edge()).
+        
+        Time Complexity: O(E log E), see build_csr()
+        
+        Returns:
+            The graph itself, for chaining
+        """
+        if self.frozen:
+            return self
+        
+        indptr, indices, weights = build_csr(self.num_nodes, self._edges)
+        self._set_csr(indptr, indices, weights)
+        return self
+    
+    def to_csr(self):
+        """
+        Get the graph as a SciPy CSR matrix (requires SciPy).
+        
+        Returns:
+            scipy.sparse.csr_matrix of shape (num_nodes, num_nodes)
+        """
+        if self._csr is None:
+            indptr, indices, weights = self.csr_arrays()
+            rows = np.repeat(np.arange(self.num_nodes), np.diff(indptr))
+            
+            # Keep the lightest edge if the same pair was added more than once
+            # (the COO constructor would sum duplicates instead)
+            order = np.lexsort((weights, indices, rows))
+            rows, cols, data = rows[order], indices[order], weights[order]
+            keep = np.ones(len(order), dtype=np.bool_)
+            keep[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            rows, cols, data = rows[keep], cols[keep], data[keep]
+            
+            csr_indptr = np.zeros(self.num_nodes + 1, dtype=np.int32)
+            csr_indptr[1:] = np.cumsum(np.bincount(rows, minlength=self.num_nodes))
+            self._csr = csr_matrix((data.astype(np.float64), cols, csr_indptr),
+                                   shape=(self.num_nodes, self.num_nodes))
+        return self._csr
+    
+    def dense_weights(self) -> np.ndarray:
+        """
+        Get the dense weight matrix, building it on first use.
+        
+        Needs O(V^2) memory, so only the dense Dijkstra fallback calls it.
+        
+        Returns:
+            W: (num_nodes, num_nodes) float64 array, W[u, v] = lightest edge
+                weight between u and v, inf if there is no direct edge
+        """
+        if self.W is None:
+            indptr, indices, weights = self.csr_arrays()
+            n = self.num_nodes
+            rows = np.repeat(np.arange(n), np.diff(indptr))
+            self.W = np.full((n, n), np.inf, dtype=np.float64)
+            np.minimum.at(self.W, (rows, indices), weights)
+        return self.W
+    
+    def csr_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Dijkstra's algorithm to find shortest paths from start_node to all other nodes.
+        Get the graph as plain CSR arrays, freezing it if needed.
+        
+        Returns:
+            indptr: int32 array of length num_nodes + 1
+            indices: int32 array of neighbor node IDs
+            weights: int32, float32 or float64 array of edge weights, aligned with indices
+        """
+        self.freeze()
+        return self.indptr, self.indices, self.weights
+    
+    @classmethod
+    def from_csr(cls, num_nodes: int, indptr: np.ndarray, indices: np.ndarray,
+                 weights: np.ndarray) -> 'Graph':
+        """
+        Build a frozen graph that shares existing symmetric CSR arrays.
+        
+        Args:
+            num_nodes: Total number of nodes
+            indptr, indices, weights: CSR arrays as returned by build_csr()
+        
+        Returns:
+            Frozen Graph aliasing the given arrays (no copy), except that
+            indptr and indices of another integer type are converted to int32
+        """
+        graph = cls(num_nodes)
+        graph._set_csr(np.asarray(indptr, dtype=np.int32),
+                       np.asarray(indices, dtype=np.int32), weights)
+        return graph
+    
+    @classmethod
+    def from_edges(cls, num_nodes: int, edges) -> 'Graph':
+        """
+        Build a frozen graph from all edges at once.
+        
+        Equivalent to calling add_edge() for every edge and then freeze(),
+        but the edges go straight into CSR arrays with one sort.
+        
+        Args:
+            num_nodes: Total number of nodes
+            edges: Sequence or (E, 3) array of (source, destination, weight)
+        
+        Returns:
+            Frozen Graph
+        """
+        return cls.from_csr(num_nodes, *build_csr(num_nodes, edges))
+    
+    @classmethod
+    def from_static(cls) -> 'Graph':
+        """
+        Build the scenario network from the CSR arrays precomputed in data.py.
+        
+        Returns:
+            Frozen Graph of all relief centers and disaster zones
+        """
+        from data import ADJ_INDPTR, ADJ_INDICES, ADJ_WEIGHTS, get_total_nodes
+        return cls.from_csr(get_total_nodes(), ADJ_INDPTR, ADJ_INDICES, ADJ_WEIGHTS)
+    
+    def permuted(self, perm: np.ndarray) -> 'Graph':
+        """
+        Relabel the nodes so that new node k is old node perm[k].
+        
+        Used to apply a bandwidth-reducing order (e.g. reverse Cuthill-McKee)
+        so that each node's neighbors have nearby IDs and the shortest-path
+        kernels touch fewer cache lines.
+        
+        Time Complexity: O(V + E)
+        
+        Args:
+            perm: Permutation of range(num_nodes)
+        
+        Returns:
+            New frozen Graph; old node v is new node inverse[v] where
+            inverse[perm] = arange(num_nodes)
+        """
+        indptr, indices, weights = self.csr_arrays()
+        perm = np.asarray(perm, dtype=np.int32)
+        inverse = np.empty_like(perm)
+        inverse[perm] = np.arange(self.num_nodes, dtype=np.int32)
+        
+        # Row k of the new graph is row perm[k] of the old one
+        degrees = np.diff(indptr)[perm]
+        new_indptr = np.zeros(self.num_nodes + 1, dtype=np.int32)
+        new_indptr[1:] = np.cumsum(degrees)
+        order = (np.repeat(indptr[perm] - new_indptr[:-1], degrees)
+                 + np.arange(len(indices), dtype=np.int32))
+        
+        return Graph.from_csr(self.num_nodes, new_indptr, inverse[indices[order]],
+                              weights[order])
+    
+    def _set_csr(self, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+        """Install CSR arrays and mark the graph frozen."""
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        
+        self._edges = None
+        self.frozen = True
+    
+    def _unfreeze(self):
+        """Turn the CSR arrays back into an edge list and drop every derived form."""
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        rows = np.repeat(np.arange(self.num_nodes), np.diff(indptr))
+        
+        # Each edge is stored in both directions. build_csr() puts both copies
+        # of a self-loop in its own row, first copies ahead of second ones
+        loops = np.flatnonzero(rows == indices)
+        loop_rows = rows[loops]
+        rank = np.arange(len(loops)) - np.searchsorted(loop_rows, loop_rows)
+        first_copy = rank < np.bincount(loop_rows, minlength=self.num_nodes)[loop_rows] // 2
+        keep = np.sort(np.concatenate([np.flatnonzero(rows < indices), loops[first_copy]]))
+        self._edges = list(zip(rows[keep].tolist(), indices[keep].tolist(),
+                               weights[keep].tolist()))
+        
+        # The arrays may be shared (from_csr), so drop them rather than edit
+        self.indptr = None
+        self.indices = None
+        self.weights = None
+        self.W = None
+        self._csr = None
+        self.frozen = False
+    
+    def dijkstra_arrays(self, start_node: int,
+                        targets: Union[List[int], np.ndarray] = None
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Shortest paths from start_node to all other nodes, as arrays.
+        
+        Runs the Numba-compiled heap Dijkstra on the CSR arrays when Numba is
+        installed. Otherwise sparse graphs (see SPARSE_FILL) use the heapq
+        version and dense ones the vectorized dense-matrix version.
+        
+        Args:
+            start_node: The node to start from (relief center)
+            targets: Optional nodes of interest; the search stops once all of
+                them are settled, so only their entries are guaranteed exact
+        
+        Returns:
+            dist: Array of shortest distances from start_node (inf if unreachable)
+            prev: Array of previous node in shortest path (-1 if none)
+        """
+        indptr, indices, weights = self.csr_arrays()
+        
+        target_mask = np.zeros(self.num_nodes, dtype=np.bool_)
+        if targets is not None and len(targets):
+            target_mask[np.asarray(targets, dtype=np.intp)] = True
+        
+        backend = self.dijkstra_backend()
+        if backend == 'numba':
+            return _dijkstra_csr(indptr, indices, weights, start_node, self.num_nodes,
+                                 target_mask)
+        if backend == 'heapq':
+            return _dijkstra_heap(indptr, indices, weights, start_node, self.num_nodes,
+                                  target_mask)
+        return self._dijkstra_dense(start_node, target_mask)
+    
+    def dijkstra_backend(self) -> str:
+        """
+        Name the single-source search dijkstra_arrays() runs on this graph.
+        
+        Returns:
+            'numba' for the compiled indexed heap, 'heapq' for the Python
+            heap on sparse graphs, or 'dense' for the vectorized NumPy search
+        """
+        if njit is not None:
+            return 'numba'
+        if len(self.csr_arrays()[1]) < SPARSE_FILL * self.num_nodes ** 2:
+            return 'heapq'
+        return 'dense'
+    
+    def _dijkstra_dense(self, start_node: int,
+                        target_mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Dijkstra's algorithm on the dense weight matrix using NumPy.
         
         Algorithm Steps:
         1. Initialize all distances to infinity except start node (distance = 0)
-        2. Use a min-heap priority queue to always process the nearest unvisited node
-        3. For each node, update distances to its neighbors if a shorter path is found
+        2. Pick the nearest unsettled node with a single argmin over the array
+        3. Relax all of its neighbors at once with a vectorized minimum
         4. Continue until all reachable nodes are processed
         
-        Time Complexity: O((V + E) log V) with min-heap
-        - Each vertex is inserted and extracted once: O(V log V)
-        - Each edge is relaxed once: O(E log V)
+        Time Complexity: O(V^2)
+        - V iterations, each doing O(V) work inside NumPy (no Python per edge)
+        - Optimal for dense graphs such as ours, where E is close to V^2
         
         Args:
             start_node: The node to start from (relief center)
+            target_mask: Boolean array; stop once all flagged nodes are
+                settled (all False means search everything)
         
         Returns:
-            distances: Dictionary mapping node_id to shortest distance from start_node
-            previous: Dictionary mapping node_id to previous node in shortest path
+            dist: Array of shortest distances from start_node (inf if unreachable)
+            prev: Array of previous node in shortest path (-1 if none)
         """
-        # Initialize distances to infinity
-        distances = {i: float('inf') for i in range(self.num_nodes)}
-        distances[start_node] = 0
+        n = self.num_nodes
+        dist = np.full(n, np.inf, dtype=np.float64)
+        dist[start_node] = 0.0
+        prev = np.full(n, -1, dtype=np.int64)
         
-        # Track previous node in shortest path (for path reconstruction)
-        previous = {i: None for i in range(self.num_nodes)}
+        # Tentative distances of unsettled nodes; settling a node sets its
+        # entry to inf, so no separate visited mask is needed
+        frontier = dist.copy()
+        W = self.dense_weights()
         
-        # Priority queue: (distance, node)
-        # Min-heap ensures we always process the nearest unvisited node
-        priority_queue = [(0, start_node)]
+        remaining = int(target_mask.sum()) or -1  # -1: never stop early
         
-        # Set to track visited nodes
-        visited = set()
-        
-        while priority_queue:
-            # Extract node with minimum distance
-            # Time Complexity: O(log V) for heap extraction
-            current_distance, current_node = heapq.heappop(priority_queue)
+        for _ in range(n):
+            # Extract nearest unsettled node: O(V) in C instead of heap ops
+            u = int(np.argmin(frontier))
             
-            # Skip if already visited (optimization)
-            if current_node in visited:
-                continue
+            # Remaining nodes are unreachable
+            if frontier[u] == np.inf:
+                break
             
-            visited.add(current_node)
+            frontier[u] = np.inf
             
-            # If current distance is greater than recorded, skip
-            if current_distance > distances[current_node]:
-                continue
+            # Stop once every target is settled
+            if target_mask[u]:
+                remaining -= 1
+                if remaining == 0:
+                    break
             
-            # Explore neighbors
-            for neighbor, weight in self.adjacency_list[current_node]:
-                distance = current_distance + weight
-                
-                # Relaxation step: Update if shorter path found
-                if distance < distances[neighbor]:
-                    distances[neighbor] = distance
-                    previous[neighbor] = current_node
-                    # Time Complexity: O(log V) for heap insertion
-                    heapq.heappush(priority_queue, (distance, neighbor))
+            # Relaxation step for every neighbor of u in one shot;
+            # settled nodes can never improve
+            candidate = dist[u] + W[u]
+            improved = candidate < dist
+            prev[improved] = u
+            dist[improved] = candidate[improved]
+            frontier[improved] = candidate[improved]
+        
+        return dist, prev
+    
+    def dijkstra(self, start_node: int) -> Tuple[Dict[int, float], Dict[int, int]]:
+        """
+        Shortest paths from start_node to all other nodes, as dictionaries.
+        
+        Thin wrapper around dijkstra_arrays() kept for API compatibility.
+        
+        Args:
+            start_node: The node to start from (relief center)
+        
+        Returns:
+            distances: Dictionary mapping node_id to shortest distance from start_node
+            previous: Dictionary mapping node_id to previous node in shortest path
+        """
+        dist, prev = self.dijkstra_arrays(start_node)
+        
+        distances = {i: float(d) for i, d in enumerate(dist)}
+        previous = {i: (int(p) if p >= 0 else None) for i, p in enumerate(prev)}
         
         return distances, previous
     
-    def get_shortest_path(self, start: int, end: int, previous: Dict[int, int]) -> List[int]:
+    def get_shortest_path(self, start: int, end: int,
+                          previous: Union[np.ndarray, Dict[int, int]]
+                          ) -> Union[np.ndarray, List[int]]:
         """
         Reconstruct the shortest path from start to end using previous nodes.
         
+        The path is written back-to-front into a preallocated buffer, so it
+        comes out in start-to-end order without a reversal or copy.
+        
         Time Complexity: O(V) in worst case (path length)
         
         Args:
             start: Starting node
             end: Ending node
-            previous: Dictionary from dijkstra algorithm
+            previous: Predecessor array from dijkstra_arrays (-1 = none), or
+                predecessor dictionary from dijkstra (None = none)
         
         Returns:
-            List of nodes representing the shortest path
+            Array of nodes representing the shortest path (empty if none);
+            a list when previous is a dictionary
+        
+        Raises:
+            ValueError: If previous contains a cycle
         """
-        path = []
+        buffer = np.empty(self.num_nodes, dtype=np.int64)
+        i = self.num_nodes
         current = end
         
         # Backtrack from end to start
-        while current is not None:
-            path.append(current)
+        while current is not None and current != -1:
+            if i == 0:
+                raise ValueError("Predecessors form a cycle, not a shortest-path tree")
+            i -= 1
+            buffer[i] = current
             current = previous[current]
         
-        # Reverse to get path from start to end
-        path.reverse()
+        path = buffer[i:]
         
         # Return path only if it starts from the correct start node
-        if path and path[0] == start:
-            return path
-        else:
-            return []  # No path exists
+        if not (path.size and path[0] == start):
+            path = buffer[:0]  # No path exists
+        
+        return path.tolist() if isinstance(previous, dict) else path
+
+
+def shortest_path_backend(graph: Graph) -> str:
+    """
+    Name the search compute_all_shortest_paths() runs on graph.
+    
+    Returns:
+        'scipy' for one batched csgraph call over all sources, otherwise
+        graph.dijkstra_backend() (run once per source, on threads for 'numba')
+    """
+    if csgraph_dijkstra is not None:
+        return 'scipy'
+    return graph.dijkstra_backend()
 
 
 def compute_all_shortest_paths(graph: Graph, relief_centers: List[int], 
-                               disaster_zones: List[int]) -> Dict[Tuple[int, int], float]:
+                               disaster_zones: List[int]
+                               ) -> Tuple[np.ndarray, Dict[int, int], Dict[int, int]]:
     """
     Compute shortest distances from all relief centers to all disaster zones.
     
-    Time Complexity: O(R * (V + E) log V)
-    where R = number of relief centers
+    Results are memoized by a fingerprint of the graph (its node count and
+    CSR arrays) plus the center and zone IDs, so repeated calls on an unchanged
+    network skip Dijkstra entirely.
+    
+    Time Complexity: O(R * (V + E) log V) with SciPy or Numba,
+    O(R * V^2) with NumPy alone on dense graphs, O(R + Z) on a cache hit
+    where R = number of relief centers, Z = number of disaster zones
     
     Args:
         graph: The graph representing the network
@@ -140,19 +644,81 @@ def compute_all_shortest_paths(graph: Graph, relief_centers: List[int],
         disaster_zones: List of disaster zone node IDs
     
     Returns:
-        Dictionary mapping (center_id, zone_id) to shortest distance
+        dist_matrix: Read-only R x Z float64 array; dist_matrix[i, j] is the
+            distance from relief_centers[i] to disaster_zones[j] (inf if unreachable)
+        center_index: Dictionary mapping center ID to its row in dist_matrix
+        zone_index: Dictionary mapping zone ID to its column in dist_matrix
+    """
+    indptr, indices, weights = graph.csr_arrays()
+    graph_key = (graph.num_nodes,) + tuple(
+        (array.dtype.str, array.tobytes()) for array in (indptr, indices, weights))
+    
+    dist_matrix = _compute_uncached(graph_key, tuple(relief_centers), tuple(disaster_zones))
+    center_index = {center: i for i, center in enumerate(relief_centers)}
+    zone_index = {zone: j for j, zone in enumerate(disaster_zones)}
+    return dist_matrix, center_index, zone_index
+
+
+@lru_cache(maxsize=32)
+def _compute_uncached(graph_key: Tuple, centers_key: Tuple[int, ...],
+                      zones_key: Tuple[int, ...]) -> np.ndarray:
+    """
+    Memoized worker for compute_all_shortest_paths.
+    
+    With SciPy installed, the nodes are first relabelled in reverse
+    Cuthill-McKee order for better locality, then all sources are solved in
+    a single native scipy.sparse.csgraph.dijkstra call; otherwise
+    Graph.dijkstra_arrays is run once per relief center, bounded to stop
+    when every zone is settled (on a thread pool when the Numba kernel is
+    available). Either way, results use the original IDs.
+    
+    Args:
+        graph_key: (num_nodes, indptr, indices, weights) with each CSR array
+            given as a (dtype, raw bytes) pair
+        centers_key: Tuple of relief center node IDs
+        zones_key: Tuple of disaster zone node IDs
+    
+    Returns:
+        Read-only R x Z float64 distance matrix (shared between cache hits)
     """
-    shortest_distances = {}
+    num_nodes, *arrays = graph_key
+    graph = Graph.from_csr(num_nodes, *(np.frombuffer(data, dtype=dtype)
+                                        for dtype, data in arrays))
+    
+    # label[v] = ID of original node v in the graph actually searched
+    label = np.arange(num_nodes)
+    if reverse_cuthill_mckee is not None:
+        perm = reverse_cuthill_mckee(graph.to_csr(), symmetric_mode=True)
+        graph = graph.permuted(perm)
+        label[perm] = np.arange(num_nodes)
+    
+    center_labels = label[list(centers_key)]
+    zone_labels = label[list(zones_key)]
     
-    # Run Dijkstra from each relief center
-    for center in relief_centers:
-        distances, _ = graph.dijkstra(center)
+    backend = shortest_path_backend(graph)
+    if backend == 'scipy':
+        # One C-level call returns an R x V distance matrix
+        full = csgraph_dijkstra(graph.to_csr(), directed=False, indices=center_labels)
+    else:
+        # Run Dijkstra from each relief center, stopping once all zones settle
+        targets = zone_labels.tolist()
         
-        # Store distances to each disaster zone
-        for zone in disaster_zones:
-            shortest_distances[(center, zone)] = distances[zone]
+        def search(center) -> np.ndarray:
+            return graph.dijkstra_arrays(int(center), targets=targets)[0]
+        
+        if backend == 'numba' and len(center_labels) > 1:
+            # The compiled kernel releases the GIL, so the independent
+            # searches run in parallel on threads sharing the CSR arrays
+            with ThreadPoolExecutor() as pool:
+                rows = list(pool.map(search, center_labels))
+        else:
+            rows = [search(center) for center in center_labels]
+        full = np.array(rows).reshape(len(centers_key), num_nodes)
     
-    return shortest_distances
+    # Keep only the disaster zone columns
+    dist_matrix = np.ascontiguousarray(full[:, zone_labels], dtype=np.float64)
+    dist_matrix.setflags(write=False)
+    return dist_matrix
 
 
 if __name__ == "__main__":
@@ -161,19 +727,20 @@ if __name__ == "__main__":
     print("=" * 50)
     
     # Create a simple test graph
-    g = Graph(5)
-    g.add_edge(0, 1, 10)
-    g.add_edge(0, 2, 5)
-    g.add_edge(1, 2, 2)
-    g.add_edge(1, 3, 1)
-    g.add_edge(2, 3, 9)
-    g.add_edge(3, 4, 4)
+    g = Graph.from_edges(5, [
+        (0, 1, 10),
+        (0, 2, 5),
+        (1, 2, 2),
+        (1, 3, 1),
+        (2, 3, 9),
+        (3, 4, 4),
+    ])
     
     # Run Dijkstra from node 0
-    distances, previous = g.dijkstra(0)
+    distances, previous = g.dijkstra_arrays(0)
     
     print("Shortest distances from node 0:")
-    for node, dist in distances.items():
+    for node, dist in enumerate(distances):
         print(f"  Node {node}: {dist}")
     
     print("\nShortest path from 0 to 4:")
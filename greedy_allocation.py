@@ -1,9 +1,29 @@
-from typing import List, Dict, Tuple
+import sys
+from collections.abc import Mapping
+from typing import Callable, List, Dict, Tuple, Union
+
+import numpy as np
+
+
+# One allocation record: the other party's node ID, amount and distance
+ALLOCATION_DTYPE = np.dtype([('id', 'i4'), ('amount', 'f8'), ('distance', 'f8')])
+
+
+def _grow_records(records: np.ndarray, count: int, capacity: int) -> np.ndarray:
+    """Return a record buffer holding at least capacity rows, keeping the first count."""
+    if capacity <= len(records):
+        return records
+    grown = np.zeros(capacity, dtype=ALLOCATION_DTYPE)
+    grown[:count] = records[:count]
+    return grown
 
 
 class ReliefCenter:
     """Represents a relief center with available supplies."""
     
+    __slots__ = ('center_id', 'name', 'initial_supply', 'remaining_supply', 'allocations',
+                 'num_allocations')
+    
     def __init__(self, center_id: int, name: str, supply: float):
         """
         Initialize a relief center.
@@ -17,25 +37,30 @@ class ReliefCenter:
         self.name = name
         self.initial_supply = supply
         self.remaining_supply = supply
-        self.allocations = []  # List of (zone, amount, distance)
+        # Record array of (zone id, amount, distance); rows past
+        # num_allocations are unused capacity
+        self.allocations = np.zeros(0, dtype=ALLOCATION_DTYPE)
+        self.num_allocations = 0
+    
+    def reserve(self, capacity: int):
+        """Make room for at least capacity allocation records."""
+        self.allocations = _grow_records(self.allocations, self.num_allocations, capacity)
     
-    def allocate(self, zone_id: int, zone_name: str, amount: float, distance: float):
+    def allocate(self, zone_id: int, amount: float, distance: float):
         """
         Allocate supplies to a disaster zone.
         
         Args:
             zone_id: ID of the disaster zone
-            zone_name: Name of the disaster zone
             amount: Amount to allocate
             distance: Distance to the zone
         """
+        if self.num_allocations == len(self.allocations):
+            self.reserve(max(4, 2 * len(self.allocations)))
+        
         self.remaining_supply -= amount
-        self.allocations.append({
-            'zone_id': zone_id,
-            'zone_name': zone_name,
-            'amount': amount,
-            'distance': distance
-        })
+        self.allocations[self.num_allocations] = (zone_id, amount, distance)
+        self.num_allocations += 1
     
     def __str__(self):
         return f"{self.name} (ID: {self.center_id}, Supply: {self.initial_supply})"
@@ -44,6 +69,9 @@ class ReliefCenter:
 class DisasterZone:
     """Represents a disaster zone with demand and priority."""
     
+    __slots__ = ('zone_id', 'name', 'initial_demand', 'remaining_demand', 'priority',
+                 'allocations', 'num_allocations')
+    
     def __init__(self, zone_id: int, name: str, demand: float, priority: int):
         """
         Initialize a disaster zone.
@@ -59,25 +87,30 @@ class DisasterZone:
         self.initial_demand = demand
         self.remaining_demand = demand
         self.priority = priority
-        self.allocations = []  # List of (center, amount, distance)
+        # Record array of (center id, amount, distance); rows past
+        # num_allocations are unused capacity
+        self.allocations = np.zeros(0, dtype=ALLOCATION_DTYPE)
+        self.num_allocations = 0
     
-    def receive(self, center_id: int, center_name: str, amount: float, distance: float):
+    def reserve(self, capacity: int):
+        """Make room for at least capacity allocation records."""
+        self.allocations = _grow_records(self.allocations, self.num_allocations, capacity)
+    
+    def receive(self, center_id: int, amount: float, distance: float):
         """
         Receive supplies from a relief center.
         
         Args:
             center_id: ID of the relief center
-            center_name: Name of the relief center
             amount: Amount received
             distance: Distance from the center
         """
+        if self.num_allocations == len(self.allocations):
+            self.reserve(max(4, 2 * len(self.allocations)))
+        
         self.remaining_demand -= amount
-        self.allocations.append({
-            'center_id': center_id,
-            'center_name': center_name,
-            'amount': amount,
-            'distance': distance
-        })
+        self.allocations[self.num_allocations] = (center_id, amount, distance)
+        self.num_allocations += 1
     
     def is_fulfilled(self) -> bool:
         """Check if demand is fully met."""
@@ -87,6 +120,46 @@ class DisasterZone:
         return f"{self.name} (ID: {self.zone_id}, Demand: {self.initial_demand}, Priority: {self.priority})"
 
 
+def _greedy_pass(zone_order: Tuple[int, ...], preferences: Tuple[Tuple[int, ...], ...],
+                 supply: List[float], demand: List[float]) -> List[Tuple[int, int, float]]:
+    """
+    Core greedy loop over plain Python lists.
+    
+    Every decision the loop would otherwise compute at run time is supplied
+    up front: the zone order and, for each zone, its reachable centers
+    sorted nearest first. All that is left is walking those tuples with
+    local float arithmetic.
+    
+    Time Complexity: O(Z * R)
+    
+    Args:
+        zone_order: Zone indices in allocation order
+        preferences: preferences[j] = center indices for zone j, nearest first
+        supply: Remaining supply per center (updated in place)
+        demand: Remaining demand per zone (updated in place)
+    
+    Returns:
+        List of (center_idx, zone_idx, amount) allocations in the order made
+    """
+    allocations = []
+    for j in zone_order:
+        need = demand[j]
+        for i in preferences[j]:
+            if need <= 0.001:  # Small epsilon for floating point
+                break
+            available = supply[i]
+            if available <= 0.001:  # Center already exhausted
+                continue
+            
+            # Allocate as much as possible from the nearest center with supply
+            amount = min(need, available)
+            supply[i] = available - amount
+            need -= amount
+            allocations.append((i, j, amount))
+        demand[j] = need
+    return allocations
+
+
 class GreedyAllocator:
     """
     Greedy algorithm for allocating relief supplies.
@@ -98,181 +171,478 @@ class GreedyAllocator:
     """
     
     def __init__(self, centers: List[ReliefCenter], zones: List[DisasterZone],
-                 distances: Dict[Tuple[int, int], float]):
+                 distances: Union[Dict[Tuple[int, int], float],
+                                  Tuple[np.ndarray, Dict[int, int], Dict[int, int]]],
+                 verbose: bool = False):
         """
         Initialize the allocator.
         
         Args:
             centers: List of relief centers
             zones: List of disaster zones
-            distances: Dictionary mapping (center_id, zone_id) to distance
+            distances: Either a (dist_matrix, center_index, zone_index) tuple as
+                returned by compute_all_shortest_paths, or a dictionary mapping
+                (center_id, zone_id) to distance
+            verbose: Print the allocation order and each allocation made
         """
         self.centers = {c.center_id: c for c in centers}
         self.zones = {z.zone_id: z for z in zones}
         self.distances = distances
         self.total_distance_covered = 0
         self.total_supplies_delivered = 0
+        self.verbose = verbose
+        # Progress messages, written out in one go by _flush_log()
+        self._log = []
+        
+        # Struct-of-arrays working state: row i = center, column j = zone.
+        # The ReliefCenter/DisasterZone objects are only updated when the
+        # report is generated (see _sync_views).
+        self._center_list = list(self.centers.values())
+        self._zone_list = list(self.zones.values())
+        self.supply_remaining = np.array(
+            [c.remaining_supply for c in self._center_list], dtype=np.float64)
+        self.demand_remaining = np.array(
+            [z.remaining_demand for z in self._zone_list], dtype=np.float64)
+        self.priority = np.array(
+            [z.priority for z in self._zone_list], dtype=np.int8)
+        if isinstance(distances, tuple):
+            # Pick out (and reorder) the matrix rows and columns we need
+            matrix, center_index, zone_index = distances
+            self.dist_matrix = np.array(matrix[np.ix_(
+                [center_index[c.center_id] for c in self._center_list],
+                [zone_index[z.zone_id] for z in self._zone_list]
+            )], dtype=np.float64)
+        else:
+            self.dist_matrix = np.array(
+                [[distances[(c.center_id, z.zone_id)] for z in self._zone_list]
+                 for c in self._center_list],
+                dtype=np.float64
+            ).reshape(len(self._center_list), len(self._zone_list))
+        
+        # Live (center, zone) pairs: a row is cleared when the center runs
+        # out of supply, a column when the zone's demand is met
+        self.mask = np.isfinite(self.dist_matrix)
+        
+        # Distances are fixed, so each zone's center preference order is too:
+        # reachable centers sorted nearest first (stable, so ties keep input order)
+        nearest_first = np.argsort(self.dist_matrix, axis=0, kind='stable')
+        self._preferences = tuple(
+            tuple(int(i) for i in nearest_first[:, j] if self.mask[i, j])
+            for j in range(len(self._zone_list))
+        )
+        
+        # Each center allocates to a zone at most once per run, and vice versa
+        for center in self._center_list:
+            center.reserve(center.num_allocations + len(self._zone_list))
+        for zone in self._zone_list:
+            zone.reserve(zone.num_allocations + len(self._center_list))
+        
+        # Allocations made so far as (center_idx, zone_idx, amount, distance)
+        self._records = []
+        self._synced = 0
+        
+        # Zone visiting order, sorted once and reused by every run
+        self._sorted_zone_idx = ()
+        self._order_dirty = True
     
-    def allocate_resources(self) -> Dict:
+    def invalidate_zone_order(self):
+        """
+        Re-read zones on the next run; call after changing a zone's priority or demand.
+        
+        The next run reloads each zone's remaining demand and priority from
+        its DisasterZone object before sorting.
+        """
+        self._order_dirty = True
+    
+    def _refresh_zones(self):
+        """Reload demand and priority from the DisasterZone objects."""
+        self._sync_views()
+        was_met = self.demand_remaining <= 0.001
+        self.demand_remaining = np.array(
+            [z.remaining_demand for z in self._zone_list], dtype=np.float64)
+        self.priority = np.array(
+            [z.priority for z in self._zone_list], dtype=np.int8)
+        
+        # Reopen zones whose demand was met but has since grown, for every
+        # reachable center that still has supplies
+        reopened = was_met & (self.demand_remaining > 0.001)
+        self.mask[:, reopened] = (
+            np.isfinite(self.dist_matrix[:, reopened])
+            & (self.supply_remaining > 0.001)[:, None]
+        )
+    
+    def _zone_order(self) -> Tuple[int, ...]:
+        """
+        Zone indices sorted by priority (ascending), then by demand (descending).
+        
+        When the order is stale, zone demand and priority are reloaded first.
+        
+        Time Complexity: O(Z log Z) when the order is stale, O(1) otherwise
+        
+        Returns:
+            Tuple of zone column indices in allocation order
+        """
+        if self._order_dirty:
+            self._refresh_zones()
+            self._sorted_zone_idx = tuple(sorted(
+                range(len(self._zone_list)),
+                key=lambda j: (self._zone_list[j].priority, -self._zone_list[j].initial_demand)
+            ))
+            self._order_dirty = False
+        return self._sorted_zone_idx
+    
+    def allocate_resources(self) -> 'LazyReport':
         """
         Execute the greedy allocation algorithm.
         
         Algorithm Steps:
         1. Sort zones by priority (highest first), then by demand (highest first)
-        2. For each zone in sorted order:
-           a. While zone has remaining demand:
-              - Find nearest center with available supply
-              - Allocate as much as possible from that center
-              - Update supplies and demands
+        2. For each zone in sorted order, walk its centers nearest first:
+           - Skip centers with no supply left
+           - Allocate as much as possible from that center
+           - Stop once the zone's demand is met
         
-        Time Complexity: O(Z log Z + Z * R * A)
-        where Z = zones, R = centers, A = allocations per zone (usually small)
+        Time Complexity: O(Z log Z + Z * R)
+        where Z = zones, R = centers
         
         Returns:
-            Dictionary containing allocation results and statistics
+            Mapping containing allocation results and statistics
         """
         # Step 1: Sort zones by priority (ascending), then by demand (descending)
-        # Time Complexity: O(Z log Z)
-        sorted_zones = sorted(
-            self.zones.values(),
-            key=lambda z: (z.priority, -z.initial_demand)
-        )
+        # Time Complexity: O(Z log Z), cached across runs
+        sorted_zones = self._zone_order()
+        self._log_allocation_order(sorted_zones)
         
-        print("Allocation Order (by priority and demand):")
-        print("-" * 50)
-        for i, zone in enumerate(sorted_zones, 1):
-            print(f"{i}. {zone.name} - Priority: {zone.priority}, Demand: {zone.initial_demand}")
-        print()
-        
-        # Step 2: Allocate resources to each zone
-        # Time Complexity: O(Z * R) for finding nearest center for each zone
-        for zone in sorted_zones:
-            while zone.remaining_demand > 0.001:  # Small epsilon for floating point
-                # Find nearest center with available supply
-                nearest_center = self._find_nearest_available_center(zone.zone_id)
-                
-                if nearest_center is None:
-                    # No more supplies available
-                    print(f"⚠️  Warning: Cannot fully fulfill {zone.name} "
-                          f"(shortage: {zone.remaining_demand:.2f} units)")
-                    break
-                
-                # Calculate allocation amount
-                amount = min(
-                    zone.remaining_demand,
-                    nearest_center.remaining_supply
-                )
-                
-                # Get distance
-                distance = self.distances[(nearest_center.center_id, zone.zone_id)]
-                
-                # Perform allocation
-                nearest_center.allocate(zone.zone_id, zone.name, amount, distance)
-                zone.receive(nearest_center.center_id, nearest_center.name, amount, distance)
-                
-                # Update statistics
-                self.total_supplies_delivered += amount
-                self.total_distance_covered += distance
-                
-                print(f"✓ Allocated {amount:.2f} units from {nearest_center.name} "
-                      f"to {zone.name} (distance: {distance:.2f} km)")
+        # Step 2: Allocate resources to each zone, nearest centers first
+        # Time Complexity: O(Z * R)
+        first_record = len(self._records)
+        allocations = _greedy_pass(sorted_zones, self._preferences,
+                                   self.supply_remaining.tolist(),
+                                   self.demand_remaining.tolist())
+        for i, j, amount in allocations:
+            self._record_allocation(i, j, amount, float(self.dist_matrix[i, j]))
+        
+        # Step 3: Report progress, kept out of the allocation loop
+        self._log_progress(sorted_zones, first_record)
+        self._flush_log()
         
         return self._generate_report()
     
-    def _find_nearest_available_center(self, zone_id: int) -> ReliefCenter:
-        """
-        Find the nearest relief center with available supply.
+    def _log_allocation_order(self, sorted_zones: Tuple[int, ...]):
+        """Log the order in which zones will be served (verbose mode only)."""
+        if not self.verbose:
+            return
         
-        Time Complexity: O(R) where R = number of centers
+        self._log.append("Allocation Order (by priority and demand):")
+        self._log.append("-" * 50)
+        for i, j in enumerate(sorted_zones, 1):
+            zone = self._zone_list[j]
+            self._log.append(f"{i}. {zone.name} - Priority: {zone.priority}, "
+                             f"Demand: {zone.initial_demand}")
+        self._log.append("")
+    
+    def _record_allocation(self, i: int, j: int, amount: float, distance: float):
+        """
+        Move supplies from center row i to zone column j and update statistics.
         
         Args:
-            zone_id: ID of the disaster zone
+            i: Row index of the relief center
+            j: Column index of the disaster zone
+            amount: Amount to allocate
+            distance: Distance from the center to the zone
+        """
+        self.supply_remaining[i] -= amount
+        self.demand_remaining[j] -= amount
+        self._records.append((i, j, amount, distance))
         
-        Returns:
-            Nearest center with supply, or None if no supply available
+        if self.supply_remaining[i] <= 0.001:
+            self.mask[i, :] = False
+        if self.demand_remaining[j] <= 0.001:
+            self.mask[:, j] = False
+        
+        # Update statistics
+        self.total_supplies_delivered += amount
+        self.total_distance_covered += distance
+    
+    def _log_progress(self, sorted_zones: Tuple[int, ...], first_record: int):
         """
-        nearest_center = None
-        min_distance = float('inf')
+        Log allocations made since first_record, followed by any shortages
+        (verbose mode only).
         
-        for center in self.centers.values():
-            if center.remaining_supply > 0.001:  # Has supply available
-                distance = self.distances[(center.center_id, zone_id)]
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_center = center
+        Args:
+            sorted_zones: Zone indices in the order they were served
+            first_record: Index of the first record made by this run; records
+                must be grouped by zone in sorted_zones order
+        """
+        if not self.verbose:
+            return
         
-        return nearest_center
+        records = self._records[first_record:]
+        k = 0
+        for j in sorted_zones:
+            zone = self._zone_list[j]
+            while k < len(records) and records[k][1] == j:
+                i, _, amount, distance = records[k]
+                self._log.append(f"✓ Allocated {amount:.2f} units from "
+                                 f"{self._center_list[i].name} to {zone.name} "
+                                 f"(distance: {distance:.2f} km)")
+                k += 1
+            
+            if self.demand_remaining[j] > 0.001:
+                self._log.append(f"⚠️  Warning: Cannot fully fulfill {zone.name} "
+                                 f"(shortage: {self.demand_remaining[j]:.2f} units)")
+    
+    def _flush_log(self):
+        """Write all pending progress messages with a single call."""
+        if self._log:
+            sys.stdout.write("\n".join(self._log) + "\n")
+            self._log.clear()
     
-    def _generate_report(self) -> Dict:
+    def _sync_views(self):
+        """Apply pending allocations to the ReliefCenter/DisasterZone objects."""
+        for i, j, amount, distance in self._records[self._synced:]:
+            center = self._center_list[i]
+            zone = self._zone_list[j]
+            center.allocate(zone.zone_id, amount, distance)
+            zone.receive(center.center_id, amount, distance)
+        self._synced = len(self._records)
+    
+    def _generate_report(self) -> 'LazyReport':
         """
         Generate a comprehensive allocation report.
         
+        The allocation arrays and statistics are captured immediately; the
+        per-row dictionaries in 'allocations', 'center_summary' and
+        'zone_summary' are only built when those sections are first read.
+        
         Returns:
-            Dictionary containing all allocation details and statistics
+            Mapping containing all allocation details and statistics
         """
-        report = {
-            'allocations': [],
-            'center_summary': [],
-            'zone_summary': [],
-            'statistics': {
-                'total_distance': self.total_distance_covered,
-                'total_delivered': self.total_supplies_delivered,
-                'total_demand': sum(z.initial_demand for z in self.zones.values()),
-                'total_supply': sum(c.initial_supply for c in self.centers.values()),
-                'fulfillment_rate': 0,
-                'efficiency': 0
-            }
+        self._sync_views()
+        
+        # Snapshot everything the deferred sections need, so a later run of
+        # the allocator cannot change what this report shows
+        zones = list(self.zones.values())
+        zone_records = [zone.allocations[:zone.num_allocations] for zone in zones]
+        allocations_soa = {
+            'center_id': np.concatenate([r['id'] for r in zone_records] or [np.zeros(0, np.int32)]),
+            'zone_id': np.repeat(np.array([zone.zone_id for zone in zones], dtype=np.int32),
+                                 [zone.num_allocations for zone in zones]),
+            'amount': np.concatenate([r['amount'] for r in zone_records] or [np.zeros(0)]),
+            'distance': np.concatenate([r['distance'] for r in zone_records] or [np.zeros(0)]),
+            'names': {c.center_id: c.name for c in self.centers.values()}
+                     | {z.zone_id: z.name for z in zones},
         }
+        center_rows = [(c.name, c.center_id, c.initial_supply, c.remaining_supply)
+                       for c in self.centers.values()]
+        zone_rows = [(z.name, z.zone_id, z.priority, z.initial_demand, z.remaining_demand)
+                     for z in zones]
         
-        # Allocation details
-        for zone in self.zones.values():
-            for alloc in zone.allocations:
-                report['allocations'].append({
-                    'center': alloc['center_name'],
-                    'center_id': alloc['center_id'],
-                    'zone': zone.name,
-                    'zone_id': zone.zone_id,
-                    'amount': alloc['amount'],
-                    'distance': alloc['distance']
-                })
-        
-        # Center summary
-        for center in self.centers.values():
-            total_allocated = center.initial_supply - center.remaining_supply
-            report['center_summary'].append({
-                'name': center.name,
-                'id': center.center_id,
-                'initial_supply': center.initial_supply,
-                'allocated': total_allocated,
-                'remaining': center.remaining_supply,
-                'utilization': (total_allocated / center.initial_supply * 100) if center.initial_supply > 0 else 0
-            })
-        
-        # Zone summary
-        for zone in self.zones.values():
-            total_received = zone.initial_demand - zone.remaining_demand
-            report['zone_summary'].append({
-                'name': zone.name,
-                'id': zone.zone_id,
-                'priority': zone.priority,
-                'demand': zone.initial_demand,
-                'received': total_received,
-                'shortage': zone.remaining_demand,
-                'fulfillment': (total_received / zone.initial_demand * 100) if zone.initial_demand > 0 else 0
-            })
+        statistics = {
+            'total_distance': self.total_distance_covered,
+            'total_delivered': self.total_supplies_delivered,
+            'total_demand': sum(z.initial_demand for z in self.zones.values()),
+            'total_supply': sum(c.initial_supply for c in self.centers.values()),
+            'fulfillment_rate': 0,
+            'efficiency': 0
+        }
         
         # Calculate statistics
-        total_demand = report['statistics']['total_demand']
+        total_demand = statistics['total_demand']
         if total_demand > 0:
-            report['statistics']['fulfillment_rate'] = \
+            statistics['fulfillment_rate'] = \
                 (self.total_supplies_delivered / total_demand) * 100
         
         # Efficiency: supplies delivered per km (higher is better)
         if self.total_distance_covered > 0:
-            report['statistics']['efficiency'] = \
+            statistics['efficiency'] = \
                 self.total_supplies_delivered / self.total_distance_covered
         
-        return report
+        return LazyReport({
+            'allocations': lambda: _allocation_rows(allocations_soa),
+            'allocations_soa': lambda: allocations_soa,
+            'center_summary': lambda: _center_summary(center_rows),
+            'zone_summary': lambda: _zone_summary(zone_rows),
+            'statistics': lambda: statistics,
+        })
+
+
+class LazyReport(Mapping):
+    """
+    Read-only report mapping whose sections are built on first access.
+    
+    Each key maps to a zero-argument function producing that section; the
+    result is cached, so every section is built at most once.
+    """
+    
+    __slots__ = ('_builders', '_sections')
+    
+    def __init__(self, builders: Dict[str, Callable[[], object]]):
+        """
+        Initialize the report.
+        
+        Args:
+            builders: Dictionary mapping section name to the function that builds it
+        """
+        self._builders = builders
+        self._sections = {}
+    
+    def __getitem__(self, key: str):
+        if key not in self._sections:
+            self._sections[key] = self._builders[key]()
+        return self._sections[key]
+    
+    def __iter__(self):
+        return iter(self._builders)
+    
+    def __len__(self):
+        return len(self._builders)
+
+
+def _allocation_rows(allocations_soa: Dict) -> List[Dict]:
+    """Expand the allocation arrays into one dictionary per allocation."""
+    names = allocations_soa['names']
+    return [
+        {
+            'center': names[center_id],
+            'center_id': center_id,
+            'zone': names[zone_id],
+            'zone_id': zone_id,
+            'amount': amount,
+            'distance': distance
+        }
+        for center_id, zone_id, amount, distance in zip(
+            allocations_soa['center_id'].tolist(), allocations_soa['zone_id'].tolist(),
+            allocations_soa['amount'].tolist(), allocations_soa['distance'].tolist())
+    ]
+
+
+def _center_summary(center_rows: List[Tuple]) -> List[Dict]:
+    """Build the per-center summary from (name, id, initial, remaining) rows."""
+    summary = []
+    for name, center_id, initial_supply, remaining_supply in center_rows:
+        total_allocated = initial_supply - remaining_supply
+        summary.append({
+            'name': name,
+            'id': center_id,
+            'initial_supply': initial_supply,
+            'allocated': total_allocated,
+            'remaining': remaining_supply,
+            'utilization': (total_allocated / initial_supply * 100) if initial_supply > 0 else 0
+        })
+    return summary
+
+
+def _zone_summary(zone_rows: List[Tuple]) -> List[Dict]:
+    """Build the per-zone summary from (name, id, priority, demand, remaining) rows."""
+    summary = []
+    for name, zone_id, priority, initial_demand, remaining_demand in zone_rows:
+        total_received = initial_demand - remaining_demand
+        summary.append({
+            'name': name,
+            'id': zone_id,
+            'priority': priority,
+            'demand': initial_demand,
+            'received': total_received,
+            'shortage': remaining_demand,
+            'fulfillment': (total_received / initial_demand * 100) if initial_demand > 0 else 0
+        })
+    return summary
+
+
+class MinCostFlowAllocator(GreedyAllocator):
+    """
+    Optimal allocation of relief supplies via min-cost flow.
+    
+    Strategy:
+    Build a flow network source -> center -> zone -> sink and solve it
+    with NetworkX's network simplex:
+    - source -> center: capacity = supply, cost = 0
+    - center -> zone: capacity = unlimited, cost = distance
+    - zone -> sink: capacity = demand, cost = -reward(priority)
+    
+    The per-unit reward for a zone exceeds the cost of rerouting a unit
+    through every center-to-zone arc, and each priority level earns more
+    than the one below it. So the
+    solver first serves as much high-priority demand as possible, then
+    minimizes total distance among those solutions (a lexicographic
+    objective).
+    
+    The simplex works in whole units of 1/SCALE. Capacities are rounded
+    down, so the flow never exceeds any real supply or demand. The
+    fractions cut off by that rounding (less than 1/SCALE per center and
+    per zone) are handed out afterwards by the greedy pass. The result is
+    optimal up to that granularity.
+    """
+    
+    # Amounts and distances are scaled to integers for the network simplex
+    SCALE = 100
+    
+    def allocate_resources(self) -> 'LazyReport':
+        """
+        Execute the min-cost flow allocation.
+        
+        Time Complexity: polynomial in R + Z (network simplex on a graph
+        with R + Z + 2 nodes and R * Z + R + Z arcs)
+        
+        Returns:
+            Mapping containing allocation results and statistics
+        """
+        import networkx as nx
+        
+        sorted_zones = self._zone_order()
+        self._log_allocation_order(sorted_zones)
+        
+        # Step 1: Build the flow network
+        R, Z = self.dist_matrix.shape
+        cost = np.where(self.mask, np.rint(self.dist_matrix * self.SCALE), 0).astype(np.int64)
+        # An exchange cycle uses each center -> zone arc at most once, so a
+        # step above the total arc cost outweighs any reroute it requires
+        step = int(cost.sum()) + 1
+        worst_priority = int(self.priority.max(initial=0))
+        
+        G = nx.DiGraph()
+        for i in range(R):
+            G.add_edge('source', ('c', i), weight=0,
+                       capacity=self._scaled_capacity(self.supply_remaining[i]))
+        for j in range(Z):
+            reward = step * (worst_priority - int(self.priority[j]) + 1)
+            G.add_edge(('z', j), 'sink', weight=-reward,
+                       capacity=self._scaled_capacity(self.demand_remaining[j]))
+        for i, j in zip(*np.nonzero(self.mask)):
+            G.add_edge(('c', int(i)), ('z', int(j)), weight=int(cost[i, j]))
+        
+        # Step 2: Solve
+        flow = nx.max_flow_min_cost(G, 'source', 'sink')
+        
+        # Step 3: Collect the flow per (center, zone) pair in real units
+        amounts = np.zeros((R, Z), dtype=np.float64)
+        for i in range(R):
+            for (_, j), units in flow[('c', i)].items():
+                amounts[i, j] = units / self.SCALE
+        
+        # Step 4: Hand out the fractions cut off by rounding capacities down
+        supply = (self.supply_remaining - amounts.sum(axis=1)).tolist()
+        demand = (self.demand_remaining - amounts.sum(axis=0)).tolist()
+        for i, j, amount in _greedy_pass(sorted_zones, self._preferences, supply, demand):
+            amounts[i, j] += amount
+        
+        # Step 5: Apply the allocation, grouped by zone (nearest center first)
+        first_record = len(self._records)
+        for j in sorted_zones:
+            for i in self._preferences[j]:
+                if amounts[i, j] > 0:
+                    self._record_allocation(i, j, float(amounts[i, j]),
+                                            float(self.dist_matrix[i, j]))
+        
+        self._log_progress(sorted_zones, first_record)
+        self._flush_log()
+        
+        return self._generate_report()
+    
+    def _scaled_capacity(self, amount: float) -> int:
+        """Whole 1/SCALE units that fit in amount, rounded down so flow never exceeds it."""
+        return max(0, int(np.floor(amount * self.SCALE)))
 
 
 if __name__ == "__main__":
@@ -299,10 +669,67 @@ if __name__ == "__main__":
         (1, 3): 8    # Center B to Zone 2
     }
     
-    allocator = GreedyAllocator(centers, zones, distances)
+    allocator = GreedyAllocator(centers, zones, distances, verbose=True)
     report = allocator.allocate_resources()
     
     print("\nAllocation Summary:")
     print(f"Total Delivered: {report['statistics']['total_delivered']:.2f}")
     print(f"Total Distance: {report['statistics']['total_distance']:.2f} km")
     print(f"Fulfillment Rate: {report['statistics']['fulfillment_rate']:.2f}%")
+    
+    # Fractional amounts that do not fit the min-cost flow's 1/SCALE units
+    print("\nTesting Min-Cost Flow Allocation with Fractional Amounts")
+    print("=" * 50)
+    
+    centers = [
+        ReliefCenter(0, "Center A", 0.015),
+        ReliefCenter(1, "Center B", 100.006)
+    ]
+    
+    zones = [
+        DisasterZone(2, "Zone 1", 100.006, priority=1),
+        DisasterZone(3, "Zone 2", 5, priority=2)
+    ]
+    
+    report = MinCostFlowAllocator(centers, zones, distances).allocate_resources()
+    
+    # Nothing is shipped beyond what exists, and all supply reaches a zone
+    for center in report['center_summary']:
+        assert center['remaining'] >= -1e-9, center
+    for zone in report['zone_summary']:
+        assert zone['shortage'] >= -1e-9, zone
+    assert abs(report['statistics']['total_delivered'] - 100.021) < 1e-9
+    
+    print(f"Total Delivered: {report['statistics']['total_delivered']:.3f}")
+    print(f"Zone 1 Shortage: {report['zone_summary'][0]['shortage']:.3f}")
+    
+    # Serving a critical zone can require rerouting through several arcs
+    print("\nTesting Min-Cost Flow Priority Order Across Reroutes")
+    print("=" * 50)
+    
+    centers = [
+        ReliefCenter(0, "Center A", 24),
+        ReliefCenter(1, "Center B", 20)
+    ]
+    
+    zones = [
+        DisasterZone(2, "Zone 1", 25, priority=2),
+        DisasterZone(3, "Zone 2", 3, priority=1),
+        DisasterZone(4, "Zone 3", 9, priority=2),
+        DisasterZone(5, "Zone 4", 27, priority=1)
+    ]
+    
+    inf = float('inf')
+    distances = {
+        (0, 2): 18, (0, 3): 50, (0, 4): inf, (0, 5): inf,
+        (1, 2): inf, (1, 3): 28, (1, 4): 16, (1, 5): 90
+    }
+    
+    report = MinCostFlowAllocator(centers, zones, distances).allocate_resources()
+    
+    # Center B's 20 units go to Zone 4 and Center A covers Zone 2
+    critical = sum(zone['received'] for zone in report['zone_summary']
+                   if zone['priority'] == 1)
+    assert abs(critical - 23) < 1e-9, critical
+    
+    print(f"Delivered to Critical Zones: {critical:.2f}")
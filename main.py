@@ -1,40 +1,107 @@
+import argparse
 import sys
-from typing import Dict, List
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, List, Tuple
+
+import numpy as np
 from tabulate import tabulate
 
 # Import project modules
-from dijkstra import Graph, compute_all_shortest_paths
+from dijkstra import Graph, compute_all_shortest_paths, shortest_path_backend
 from greedy_allocation import ReliefCenter, DisasterZone, GreedyAllocator
 from data import (
     RELIEF_CENTERS, DISASTER_ZONES, GRAPH_EDGES,
-    get_total_nodes, get_relief_center_ids, get_disaster_zone_ids,
-    get_node_name, print_scenario_info
+    NODE_NAMES, get_total_nodes, get_relief_center_ids, get_disaster_zone_ids,
+    print_scenario_info
+)
+
+
+# Zone priority levels as shown in the results tables
+_PRIORITY_LABELS = {1: '🔴 Critical', 2: '🟠 High', 3: '🟡 Medium', 4: '🟢 Low'}
+
+# Rows of the key metrics table in display_summary_report
+_METRIC_LABELS = (
+    "Total Supply Available",
+    "Total Demand Required",
+    "Total Supplies Delivered",
+    "Total Distance Covered",
+    "Overall Fulfillment Rate",
+    "Distribution Efficiency",
 )
+_METRIC_LABEL_WIDTH = max(map(len, _METRIC_LABELS))
+
+# Complexity rows for each dijkstra.shortest_path_backend() result:
+# (label, single-source complexity, description, all-sources complexity,
+#  overall complexity)
+_BACKEND_COMPLEXITY = {
+    'scipy': ("SciPy csgraph", "O((V + E) log V)",
+              "V = vertices, E = edges, Fibonacci heap in C\nAll centers solved in one batched call",
+              "O(R × (V + E) log V)", "O(R × (V + E) log V + Z log Z + Z × R)"),
+    'numba': ("Numba, Indexed Heap", "O((V + E) log V)",
+              "V = vertices, E = edges, compiled decrease-key heap\nRun once per relief center, on parallel threads",
+              "O(R × (V + E) log V)", "O(R × (V + E) log V + Z log Z + Z × R)"),
+    'heapq': ("heapq, Lazy Deletion", "O((V + E) log E)",
+              "V = vertices, E = edges, binary heap in Python\nRun once for each relief center",
+              "O(R × (V + E) log E)", "O(R × (V + E) log E + Z log Z + Z × R)"),
+    'dense': ("Dense, NumPy", "O(V²)",
+              "V = vertices, vectorized relaxation\nRun once for each relief center",
+              "O(R × V²)", "O(R × V² + Z log Z + Z × R)"),
+}
 
 
 def build_graph() -> Graph:
     """
     Build the graph from the data configuration.
     
+    The CSR arrays are precomputed when data.py is imported, so this only
+    wraps them.
+    
     Returns:
         Graph object with all nodes and edges
     """
-    total_nodes = get_total_nodes()
-    graph = Graph(total_nodes)
+    return Graph.from_static()
+
+
+@lru_cache(maxsize=None)
+def _load_viz():
+    """
+    Import the visualization module on first use.
+    
+    matplotlib and networkx are slow to import and optional, so they are
+    only loaded when a chart is requested; later calls reuse the module.
+    
+    Returns:
+        The visualization module
+    
+    Raises:
+        ImportError: If matplotlib or networkx is not installed
+    """
+    import visualization
+    return visualization
+
+
+def format_column(values, fmt: str) -> List[str]:
+    """
+    Format a column of numbers in one vectorized pass.
     
-    # Add all edges to the graph
-    for source, destination, weight in GRAPH_EDGES:
-        graph.add_edge(source, destination, weight)
+    Args:
+        values: Iterable of numbers
+        fmt: printf-style format applied to every value (e.g. "%.2f units")
     
-    return graph
+    Returns:
+        List of formatted strings
+    """
+    return np.char.mod(fmt, np.fromiter(values, dtype=np.float64)).tolist()
 
 
-def display_distance_matrix(distances: Dict, centers: List[int], zones: List[int]):
+def display_distance_matrix(distances: Tuple[np.ndarray, Dict[int, int], Dict[int, int]],
+                            centers: List[int], zones: List[int]):
     """
     Display shortest distances in a formatted table.
     
     Args:
-        distances: Dictionary of shortest distances
+        distances: (dist_matrix, center_index, zone_index) from compute_all_shortest_paths
         centers: List of relief center IDs
         zones: List of disaster zone IDs
     """
@@ -42,19 +109,16 @@ def display_distance_matrix(distances: Dict, centers: List[int], zones: List[int
     print("SHORTEST DISTANCES (using Dijkstra's Algorithm)")
     print("=" * 100)
     
-    # Prepare table data
-    headers = ["Relief Center"] + [get_node_name(z) for z in zones]
-    table_data = []
+    # Prepare table data: format every cell in one pass, then mark unreachable pairs
+    headers = ["Relief Center"] + [NODE_NAMES[z] for z in zones]
+    dist_matrix, center_index, zone_index = distances
+    dist_matrix = dist_matrix[np.ix_([center_index[c] for c in centers],
+                                     [zone_index[z] for z in zones])]
     
-    for center in centers:
-        row = [get_node_name(center)]
-        for zone in zones:
-            distance = distances.get((center, zone), float('inf'))
-            if distance == float('inf'):
-                row.append("∞")
-            else:
-                row.append(f"{distance:.1f} km")
-        table_data.append(row)
+    formatted = np.char.mod("%.1f km", dist_matrix).astype(object)
+    formatted[np.isinf(dist_matrix)] = "∞"
+    center_names = np.array([NODE_NAMES[c] for c in centers], dtype=object)
+    table_data = np.column_stack([center_names, formatted]).tolist()
     
     print(tabulate(table_data, headers=headers, tablefmt="grid"))
     print()
@@ -72,21 +136,21 @@ def display_allocation_results(report: Dict):
     print("=" * 100)
     
     # Allocation Details Table
-    if report['allocations']:
+    allocations = report['allocations_soa']
+    if len(allocations['amount']):
         print("\n📋 ALLOCATION DETAILS:")
         print("-" * 100)
         
         headers = ["Relief Center", "→", "Disaster Zone", "Supplies Sent", "Distance"]
-        table_data = []
+        names = allocations['names']
         
-        for alloc in report['allocations']:
-            table_data.append([
-                alloc['center'],
-                "→",
-                alloc['zone'],
-                f"{alloc['amount']:.2f} units",
-                f"{alloc['distance']:.1f} km"
-            ])
+        table_data = list(zip(
+            [names[center_id] for center_id in allocations['center_id'].tolist()],
+            repeat("→"),
+            [names[zone_id] for zone_id in allocations['zone_id'].tolist()],
+            np.char.mod("%.2f units", allocations['amount']).tolist(),
+            np.char.mod("%.1f km", allocations['distance']).tolist()
+        ))
         
         print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
     else:
@@ -97,16 +161,15 @@ def display_allocation_results(report: Dict):
     print("-" * 100)
     
     headers = ["Center Name", "Initial Supply", "Allocated", "Remaining", "Utilization"]
-    table_data = []
+    centers = report['center_summary']
     
-    for center in report['center_summary']:
-        table_data.append([
-            center['name'],
-            f"{center['initial_supply']:.2f} units",
-            f"{center['allocated']:.2f} units",
-            f"{center['remaining']:.2f} units",
-            f"{center['utilization']:.1f}%"
-        ])
+    table_data = list(zip(
+        [center['name'] for center in centers],
+        format_column((center['initial_supply'] for center in centers), "%.2f units"),
+        format_column((center['allocated'] for center in centers), "%.2f units"),
+        format_column((center['remaining'] for center in centers), "%.2f units"),
+        format_column((center['utilization'] for center in centers), "%.1f%%")
+    ))
     
     print(tabulate(table_data, headers=headers, tablefmt="grid"))
     
@@ -115,20 +178,19 @@ def display_allocation_results(report: Dict):
     print("-" * 100)
     
     headers = ["Zone Name", "Priority", "Demand", "Received", "Shortage", "Fulfillment"]
-    table_data = []
+    zones = report['zone_summary']
     
-    priority_labels = {1: '🔴 Critical', 2: '🟠 High', 3: '🟡 Medium', 4: '🟢 Low'}
+    fulfillment = np.fromiter((zone['fulfillment'] for zone in zones), dtype=np.float64)
+    fulfillment_status = np.where(fulfillment >= 99.9, "✓ ", "⚠ ")
     
-    for zone in report['zone_summary']:
-        fulfillment_status = "✓" if zone['fulfillment'] >= 99.9 else "⚠"
-        table_data.append([
-            zone['name'],
-            priority_labels.get(zone['priority'], f"P{zone['priority']}"),
-            f"{zone['demand']:.2f} units",
-            f"{zone['received']:.2f} units",
-            f"{zone['shortage']:.2f} units",
-            f"{fulfillment_status} {zone['fulfillment']:.1f}%"
-        ])
+    table_data = list(zip(
+        [zone['name'] for zone in zones],
+        [_PRIORITY_LABELS.get(zone['priority'], f"P{zone['priority']}") for zone in zones],
+        format_column((zone['demand'] for zone in zones), "%.2f units"),
+        format_column((zone['received'] for zone in zones), "%.2f units"),
+        format_column((zone['shortage'] for zone in zones), "%.2f units"),
+        np.char.add(fulfillment_status, np.char.mod("%.1f%%", fulfillment)).tolist()
+    ))
     
     print(tabulate(table_data, headers=headers, tablefmt="grid"))
 
@@ -150,16 +212,29 @@ def display_summary_report(report: Dict):
     print("\n🎯 KEY METRICS:")
     print("-" * 100)
     
-    metrics = [
-        ["Total Supply Available", f"{stats['total_supply']:.2f} units"],
-        ["Total Demand Required", f"{stats['total_demand']:.2f} units"],
-        ["Total Supplies Delivered", f"{stats['total_delivered']:.2f} units"],
-        ["Total Distance Covered", f"{stats['total_distance']:.2f} km"],
-        ["Overall Fulfillment Rate", f"{stats['fulfillment_rate']:.2f}%"],
-        ["Distribution Efficiency", f"{stats['efficiency']:.4f} units/km"],
-    ]
-    
-    print(tabulate(metrics, tablefmt="fancy_grid", colalign=("left", "right")))
+    values = np.array([
+        stats['total_supply'], stats['total_demand'], stats['total_delivered'],
+        stats['total_distance'], stats['fulfillment_rate'], stats['efficiency']
+    ], dtype=np.float64)
+    formats = np.array([
+        "%.2f units", "%.2f units", "%.2f units",
+        "%.2f km", "%.2f%%", "%.4f units/km"
+    ])
+    
+    # One vectorized pass, each value with its own format
+    cells = np.char.mod(formats, values).tolist()
+    
+    # Fixed two-column grid: only the value column width depends on the data
+    value_width = max(map(len, cells))
+    row_fmt = f"│ {{:<{_METRIC_LABEL_WIDTH}}} │ {{:>{value_width}}} │"
+    label_rule = "─" * (_METRIC_LABEL_WIDTH + 2)
+    value_rule = "─" * (value_width + 2)
+    separator = f"\n├{label_rule}┼{value_rule}┤\n"
+    
+    print(f"╒{'═' * (_METRIC_LABEL_WIDTH + 2)}╤{'═' * (value_width + 2)}╕")
+    print(separator.join(row_fmt.format(label, cell)
+                         for label, cell in zip(_METRIC_LABELS, cells)))
+    print(f"╘{'═' * (_METRIC_LABEL_WIDTH + 2)}╧{'═' * (value_width + 2)}╛")
     
     # Performance Analysis
     print("\n\n📈 PERFORMANCE ANALYSIS:")
@@ -193,26 +268,37 @@ def display_summary_report(report: Dict):
     
     # Efficiency insights
     if stats['efficiency'] > 0:
-        avg_distance = stats['total_distance'] / len(report['allocations']) if report['allocations'] else 0
+        num_allocations = len(report['allocations_soa']['amount'])
+        avg_distance = stats['total_distance'] / num_allocations if num_allocations else 0
         print(f"\n📍 Average delivery distance: {avg_distance:.2f} km")
         print(f"   Efficiency rating: {stats['efficiency']:.4f} units per km traveled")
     
     print("\n" + "=" * 100)
 
 
-def display_time_complexity_analysis():
-    """Display time complexity analysis of the algorithms used."""
+def display_time_complexity_analysis(graph: Graph):
+    """
+    Display time complexity analysis of the algorithms used.
+    
+    Args:
+        graph: The network, used to report which shortest-path search runs on it
+    """
     print("\n\n" + "=" * 100)
     print("⏱️  TIME COMPLEXITY ANALYSIS")
     print("=" * 100)
     
+    # Report the shortest-path backend compute_all_shortest_paths will use
+    backend = shortest_path_backend(graph)
+    (label, complexity, description, all_paths_complexity,
+     overall_complexity) = _BACKEND_COMPLEXITY[backend]
+    dijkstra_row = [f"Dijkstra's Algorithm\n({label})", complexity, description]
+    
     analysis = [
         ["Algorithm", "Time Complexity", "Description"],
         ["-" * 40, "-" * 30, "-" * 60],
-        ["Dijkstra's Algorithm\n(with Min-Heap)", "O((V + E) log V)", 
-         "V = vertices, E = edges\nRun once for each relief center"],
+        dijkstra_row,
         ["", "", ""],
-        ["All Shortest Paths", "O(R × (V + E) log V)", 
+        ["All Shortest Paths", all_paths_complexity, 
          "R = number of relief centers\nComputes paths from all centers"],
         ["", "", ""],
         ["Greedy Allocation\n(Sorting)", "O(Z log Z)", 
@@ -221,7 +307,7 @@ def display_time_complexity_analysis():
         ["Greedy Allocation\n(Assignment)", "O(Z × R)", 
          "For each zone, find nearest center\nUsually small constant iterations"],
         ["", "", ""],
-        ["Overall Complexity", "O(R × (V + E) log V + Z log Z + Z × R)", 
+        ["Overall Complexity", overall_complexity, 
          "Dominated by Dijkstra's algorithm\nHighly efficient for realistic scenarios"],
     ]
     
@@ -235,13 +321,47 @@ def display_time_complexity_analysis():
     print(f"  • Edges (E): {len(GRAPH_EDGES)}")
     print(f"  • Relief Centers (R): {len(get_relief_center_ids())}")
     print(f"  • Disaster Zones (Z): {len(get_disaster_zone_ids())}")
-    print(f"\n  ➜ Dijkstra runs: {len(get_relief_center_ids())} times")
+    num_centers = len(get_relief_center_ids())
+    if backend == 'scipy':
+        print(f"\n  ➜ Dijkstra runs: 1 batched call over {num_centers} sources")
+    elif backend == 'numba' and num_centers > 1:
+        print(f"\n  ➜ Dijkstra runs: {num_centers} times, on parallel threads")
+    else:
+        print(f"\n  ➜ Dijkstra runs: {num_centers} times")
     print(f"  ➜ Expected excellent performance even for much larger networks")
     print("=" * 100)
 
 
-def main():
-    """Main execution function."""
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """
+    Parse command-line options.
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    
+    Returns:
+        Namespace with interactive and visualize flags
+    """
+    parser = argparse.ArgumentParser(description="Optimal disaster relief distribution")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--interactive', dest='interactive', action='store_true', default=True,
+                      help="pause between steps and ask before visualizing (default)")
+    mode.add_argument('--batch', dest='interactive', action='store_false',
+                      help="run straight through without prompts, e.g. for profiling")
+    parser.add_argument('--visualize', action='store_true',
+                        help="in batch mode, also save the network visualization")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None):
+    """
+    Main execution function.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    args = parse_args(argv)
+    
     print("\n")
     print("╔" + "=" * 98 + "╗")
     print("║" + " " * 98 + "║")
@@ -253,7 +373,8 @@ def main():
     # Step 1: Display scenario information
     print_scenario_info()
     
-    input("\nPress Enter to start computing shortest paths using Dijkstra's algorithm...")
+    if args.interactive:
+        input("\nPress Enter to start computing shortest paths using Dijkstra's algorithm...")
     
     # Step 2: Build graph and compute shortest paths
     print("\n🔄 Building graph and computing shortest paths...")
@@ -270,7 +391,8 @@ def main():
     # Display distance matrix
     display_distance_matrix(shortest_distances, center_ids, zone_ids)
     
-    input("Press Enter to start greedy resource allocation...")
+    if args.interactive:
+        input("Press Enter to start greedy resource allocation...")
     
     # Step 3: Create relief centers and disaster zones
     print("\n🔄 Initializing relief centers and disaster zones...")
@@ -287,7 +409,7 @@ def main():
     
     # Step 4: Run greedy allocation
     print("\n🔄 Executing greedy allocation algorithm...\n")
-    allocator = GreedyAllocator(centers, zones, shortest_distances)
+    allocator = GreedyAllocator(centers, zones, shortest_distances, verbose=True)
     report = allocator.allocate_resources()
     
     # Step 5: Display results
@@ -297,7 +419,7 @@ def main():
     display_summary_report(report)
     
     # Step 7: Display complexity analysis
-    display_time_complexity_analysis()
+    display_time_complexity_analysis(graph)
     
     # Step 8: Offer visualization
     print("\n\n" + "=" * 100)
@@ -306,13 +428,20 @@ def main():
     print("\nWould you like to see a graphical visualization of the network?")
     print("(Requires matplotlib and networkx)")
     
-    response = input("\nGenerate visualization? (y/n): ").strip().lower()
+    if args.interactive:
+        response = input("\nGenerate visualization? (y/n): ").strip().lower()
+    else:
+        response = 'y' if args.visualize else 'n'
     
     if response == 'y':
         try:
-            from visualization import visualize_network
+            if not args.interactive:
+                # Charts are only saved, so skip GUI backend start-up entirely
+                import matplotlib
+                matplotlib.use('Agg')
+            viz = _load_viz()
             print("\n🔄 Generating network visualization...")
-            visualize_network(graph, center_ids, zone_ids, report['allocations'])
+            viz.visualize_network(graph, center_ids, zone_ids, report['allocations_soa'])
             print("✓ Visualization generated successfully!")
         except ImportError as e:
             print(f"\n⚠️  Could not generate visualization: {e}")
@@ -9,17 +9,107 @@ This module creates visual representations of:
 3. Allocation flows with color coding
 """
 
+import hashlib
+import os
+from collections import defaultdict
+
+import matplotlib
+
+# Batch runs only save the PNGs, so skip GUI backend start-up entirely
+BATCH = os.environ.get('BATCH', '') not in ('', '0')
+if BATCH:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import networkx as nx
+import numpy as np
 from typing import List, Dict
 from data import (
     RELIEF_CENTERS, DISASTER_ZONES, GRAPH_EDGES,
-    get_node_name
+    NODE_NAMES
 )
 
 
+# Zone node colors by priority level; anything else is drawn as low priority
+PALETTE = {
+    1: '#e74c3c',  # Red - Critical
+    2: '#e67e22',  # Orange - High
+    3: '#f39c12',  # Yellow - Medium
+}
+DEFAULT_ZONE_COLOR = '#27ae60'  # Green - Low
+
+# Scatter colors by relief center name; other centers are drawn gray
+CENTER_COLORS = {'Mumbai Relief Center': '#3498db', 
+                 'Delhi Relief Hub': '#9b59b6',
+                 'Bangalore Supply Base': '#1abc9c',
+                 'Kolkata Distribution Center': '#e67e22'}
+
+# Node positions from the first spring_layout run, reused by later runs
+# Saved next to this module so every working directory shares one cache
+LAYOUT_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'layout.npz')
+
+
+def _show_or_close():
+    """Show the current figure, or just release it on the non-interactive Agg backend."""
+    if BATCH or matplotlib.get_backend().lower() == 'agg':
+        plt.close()
+    else:
+        plt.show()
+
+
+def _edges_digest(G) -> str:
+    """Hash G's node count and weighted edges, which determine its spring layout."""
+    edges = np.array([(u, v, w) for u, v, w in G.edges(data='weight', default=1.0)],
+                     dtype=np.float64)
+    digest = hashlib.sha256(np.int64(G.number_of_nodes()).tobytes())
+    digest.update(edges.tobytes())
+    return digest.hexdigest()
+
+
+def _network_layout(G) -> Dict[int, np.ndarray]:
+    """
+    Spring layout of G, loaded from LAYOUT_CACHE when it was saved for G.
+    
+    The layout is seeded and therefore deterministic, so it is computed once
+    and saved as an (N, 2) array indexed by node ID together with a hash of
+    G's edges and weights. Any change to the network changes the hash, and
+    the stale layout is recomputed.
+    
+    Args:
+        G: NetworkX graph whose nodes are 0..N-1
+    
+    Returns:
+        Dictionary mapping node ID to its (x, y) position
+    """
+    digest = _edges_digest(G)
+    try:
+        with np.load(LAYOUT_CACHE) as cache:
+            coords = cache['coords']
+            if (str(cache['edges_digest']) == digest
+                    and coords.shape == (G.number_of_nodes(), 2)):
+                return {node: coords[node] for node in G.nodes()}
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    coords = np.array([pos[node] for node in range(G.number_of_nodes())])
+    try:
+        np.savez(LAYOUT_CACHE, coords=coords, edges_digest=digest)
+    except OSError:
+        # Read-only install; the layout is simply recomputed next run
+        pass
+    return pos
+
+
+def _edge_segments(pos: Dict[int, np.ndarray], edges) -> np.ndarray:
+    """Stack (u, v) edges into an (E, 2, 2) array of endpoint coordinates."""
+    return np.array([[pos[u], pos[v]] for u, v in edges], dtype=float).reshape(-1, 2, 2)
+
+
 def visualize_network(graph_obj, center_ids: List[int], zone_ids: List[int], 
-                     allocations: List[Dict]):
+                     allocations: Dict[str, np.ndarray], dpi: int = 150):
     """
     Create a visual representation of the relief distribution network.
     
@@ -27,7 +117,8 @@ def visualize_network(graph_obj, center_ids: List[int], zone_ids: List[int],
         graph_obj: Graph object from dijkstra module
         center_ids: List of relief center node IDs
         zone_ids: List of disaster zone node IDs
-        allocations: List of allocation dictionaries
+        allocations: Allocation arrays (report['allocations_soa'])
+        dpi: Resolution of the saved PNG
     """
     # Create a NetworkX graph
     G = nx.Graph()
@@ -50,20 +141,22 @@ def visualize_network(graph_obj, center_ids: List[int], zone_ids: List[int],
     for source, dest, weight in GRAPH_EDGES:
         G.add_edge(source, dest, weight=weight)
     
-    # Create allocation edges (for highlighting)
-    allocation_edges = set()
-    for alloc in allocations:
-        allocation_edges.add((alloc['center_id'], alloc['zone_id']))
+    # Create allocation edges (for highlighting); unordered keys so each
+    # undirected edge needs a single lookup
+    active_allocation_edges = list(zip(allocations['center_id'].tolist(),
+                                       allocations['zone_id'].tolist()))
+    allocation_edges = frozenset(frozenset(edge) for edge in active_allocation_edges)
     
     # Set up the plot
     plt.figure(figsize=(16, 12))
     
-    # Use spring layout for better visualization
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    # Use spring layout for better visualization (cached across runs)
+    pos = _network_layout(G)
     
-    # Draw different node types with different colors
-    center_nodes = [n for n in G.nodes() if n in center_ids]
-    zone_nodes = [n for n in G.nodes() if n in zone_ids]
+    # Draw different node types with different colors; the caller has
+    # already split the nodes into centers and zones
+    center_nodes = list(center_ids)
+    zone_nodes = list(zone_ids)
     
     # Draw relief centers (blue, square)
     nx.draw_networkx_nodes(G, pos, nodelist=center_nodes,
@@ -73,17 +166,8 @@ def visualize_network(graph_obj, center_ids: List[int], zone_ids: List[int],
                           label='Relief Centers')
     
     # Draw disaster zones with priority-based colors
-    zone_colors = []
-    for zone_id in zone_nodes:
-        priority = G.nodes[zone_id]['priority']
-        if priority == 1:
-            zone_colors.append('#e74c3c')  # Red - Critical
-        elif priority == 2:
-            zone_colors.append('#e67e22')  # Orange - High
-        elif priority == 3:
-            zone_colors.append('#f39c12')  # Yellow - Medium
-        else:
-            zone_colors.append('#27ae60')  # Green - Low
+    zone_colors = [PALETTE.get(G.nodes[zone_id]['priority'], DEFAULT_ZONE_COLOR)
+                   for zone_id in zone_nodes]
     
     nx.draw_networkx_nodes(G, pos, nodelist=zone_nodes,
                           node_color=zone_colors,
@@ -91,25 +175,29 @@ def visualize_network(graph_obj, center_ids: List[int], zone_ids: List[int],
                           node_size=1500,
                           label='Disaster Zones')
     
+    # Edges are drawn as two line collections, one segment array each,
+    # kept behind the nodes (zorder 2)
+    ax = plt.gca()
+    
     # Draw all edges (thin, gray)
-    all_edges = [e for e in G.edges() if e not in allocation_edges and 
-                 (e[1], e[0]) not in allocation_edges]
-    nx.draw_networkx_edges(G, pos, edgelist=all_edges,
-                          width=0.5,
-                          alpha=0.3,
-                          edge_color='gray',
-                          style='dashed')
+    all_edges = [e for e in G.edges() if frozenset(e) not in allocation_edges]
+    ax.add_collection(LineCollection(_edge_segments(pos, all_edges),
+                                     linewidths=0.5,
+                                     alpha=0.3,
+                                     colors='gray',
+                                     linestyles='dashed',
+                                     zorder=1))
     
     # Draw allocation edges (thick, green)
-    active_allocation_edges = [(a['center_id'], a['zone_id']) for a in allocations]
-    nx.draw_networkx_edges(G, pos, edgelist=active_allocation_edges,
-                          width=3,
-                          alpha=0.8,
-                          edge_color='#27ae60',
-                          style='solid')
+    ax.add_collection(LineCollection(_edge_segments(pos, active_allocation_edges),
+                                     linewidths=3,
+                                     alpha=0.8,
+                                     colors='#27ae60',
+                                     linestyles='solid',
+                                     zorder=1))
     
     # Draw labels
-    labels = {node: get_node_name(node).replace(' ', '\n') for node in G.nodes()}
+    labels = {node: NODE_NAMES[node].replace(' ', '\n') for node in G.nodes()}
     nx.draw_networkx_labels(G, pos, labels,
                            font_size=8,
                            font_weight='bold',
@@ -122,7 +210,6 @@ def visualize_network(graph_obj, center_ids: List[int], zone_ids: List[int],
               fontsize=14, fontweight='bold', pad=20)
     
     # Create custom legend
-    from matplotlib.lines import Line2D
     legend_elements = [
         Line2D([0], [0], marker='s', color='w', markerfacecolor='#3498db', 
                markersize=12, label='Relief Centers'),
@@ -143,31 +230,31 @@ def visualize_network(graph_obj, center_ids: List[int], zone_ids: List[int],
     
     # Save the figure
     filename = 'relief_distribution_network.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(filename, dpi=dpi, bbox_inches='tight', facecolor='white')
     print(f"   Visualization saved as '{filename}'")
     
-    # Show the plot
-    plt.show()
+    # Show the plot (batch runs just release the figure)
+    _show_or_close()
 
 
-def visualize_allocation_flow(allocations: List[Dict]):
+def visualize_allocation_flow(allocations: List[Dict], dpi: int = 150):
     """
     Create a bar chart showing allocation flow from centers to zones.
     
     Args:
         allocations: List of allocation dictionaries
+        dpi: Resolution of the saved PNG
     """
     if not allocations:
         print("No allocations to visualize.")
         return
     
-    # Aggregate allocations by center
-    center_allocations = {}
+    # Aggregate allocations by center and by zone in a single pass
+    center_allocations = defaultdict(float)
+    zone_allocations = defaultdict(float)
     for alloc in allocations:
-        center = alloc['center']
-        if center not in center_allocations:
-            center_allocations[center] = 0
-        center_allocations[center] += alloc['amount']
+        center_allocations[alloc['center']] += alloc['amount']
+        zone_allocations[alloc['zone']] += alloc['amount']
     
     # Create bar chart
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
@@ -183,13 +270,6 @@ def visualize_allocation_flow(allocations: List[Dict]):
     ax1.grid(axis='x', alpha=0.3)
     
     # Chart 2: Allocations by Zone
-    zone_allocations = {}
-    for alloc in allocations:
-        zone = alloc['zone']
-        if zone not in zone_allocations:
-            zone_allocations[zone] = 0
-        zone_allocations[zone] += alloc['amount']
-    
     zones = list(zone_allocations.keys())
     zone_amounts = list(zone_allocations.values())
     priority_colors = ['#e74c3c', '#e67e22', '#f39c12', '#27ae60', '#95a5a6']
@@ -203,18 +283,20 @@ def visualize_allocation_flow(allocations: List[Dict]):
     
     # Save the figure
     filename = 'allocation_flow.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(filename, dpi=dpi, bbox_inches='tight', facecolor='white')
     print(f"   Allocation flow chart saved as '{filename}'")
     
-    plt.show()
+    # Show the plot (batch runs just release the figure)
+    _show_or_close()
 
 
-def visualize_distance_vs_allocation(allocations: List[Dict]):
+def visualize_distance_vs_allocation(allocations: List[Dict], dpi: int = 150):
     """
     Create a scatter plot showing relationship between distance and allocation.
     
     Args:
         allocations: List of allocation dictionaries
+        dpi: Resolution of the saved PNG
     """
     if not allocations:
         print("No allocations to visualize.")
@@ -229,17 +311,13 @@ def visualize_distance_vs_allocation(allocations: List[Dict]):
     
     # Color code by center
     unique_centers = list(set(centers))
-    colors_map = {'Mumbai Relief Center': '#3498db', 
-                  'Delhi Relief Hub': '#9b59b6',
-                  'Bangalore Supply Base': '#1abc9c',
-                  'Kolkata Distribution Center': '#e67e22'}
     
     for center in unique_centers:
         center_distances = [d for d, c in zip(distances, centers) if c == center]
         center_amounts = [a for a, c in zip(amounts, centers) if c == center]
         plt.scatter(center_distances, center_amounts, 
                    label=center, 
-                   color=colors_map.get(center, '#95a5a6'),
+                   color=CENTER_COLORS.get(center, '#95a5a6'),
                    s=150, alpha=0.7, edgecolors='black', linewidth=1.5)
     
     plt.xlabel('Distance (km)', fontsize=12)
@@ -251,10 +329,11 @@ def visualize_distance_vs_allocation(allocations: List[Dict]):
     
     # Save the figure
     filename = 'distance_vs_allocation.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(filename, dpi=dpi, bbox_inches='tight', facecolor='white')
     print(f"   Distance vs. allocation chart saved as '{filename}'")
     
-    plt.show()
+    # Show the plot (batch runs just release the figure)
+    _show_or_close()
 
 
 if __name__ == "__main__":